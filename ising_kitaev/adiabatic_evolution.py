@@ -6,7 +6,8 @@ from collections import defaultdict
 
 import numpy as np
 
-from .trotter import trotter
+from .trotter import (trotter, trotter_step_gate_count,
+                      adaptive_trotter_step_number)
 from .coupler import mid_braiding_manipulation
 
 def estimate_gap(zeeman):
@@ -23,7 +24,8 @@ def estimate_gap(zeeman):
 
 def run_adiabatic_zeeman_change(circuit, qreg, initial_zeeman, final_zeeman,
                                 coupler_inter, gap_fraction, min_increment,
-                                delay, trotter_step_number):
+                                delay, trotter_step_number,
+                                trotter_tolerance=None):
     """Adiabatically evolve the system between two field configurations.
 
     Parameters
@@ -50,6 +52,17 @@ def run_adiabatic_zeeman_change(circuit, qreg, initial_zeeman, final_zeeman,
         Time between two update of the Zeeman field.
     trotter_step_number : int
         Number of Trotter step to perform between two fields updates.
+    trotter_tolerance : float, optional
+        If provided, the number of Trotter steps is chosen for each field
+        update as the smallest one for which the estimated Trotter error is
+        below this tolerance, and trotter_step_number is only used as a
+        reference to compute the number of gates saved.
+
+    Returns
+    -------
+    gates_saved : int
+        Number of gates saved compared to using trotter_step_number steps for
+        every update (negative if more gates were needed).
 
     """
     # Determine which sites should be updated
@@ -66,10 +79,18 @@ def run_adiabatic_zeeman_change(circuit, qreg, initial_zeeman, final_zeeman,
     zeeman_distance = np.max(np.abs(zeeman_diff))
     zeeman_update_sign = np.sign(zeeman_diff)
 
-    dt = delay / trotter_step_number
+    def evolve(zeeman):
+        if trotter_tolerance is None:
+            steps = trotter_step_number
+        else:
+            steps = adaptive_trotter_step_number(qreg, zeeman, coupler_inter,
+                                                 delay, trotter_tolerance)
+        trotter(circuit, qreg, zeeman, coupler_inter, delay / steps, steps)
+        return ((trotter_step_number - steps) *
+                trotter_step_gate_count(zeeman, coupler_inter))
+
     # First evolve the system.
-    trotter(circuit, qreg, initial_zeeman, coupler_inter, dt,
-            trotter_step_number)
+    gates_saved = evolve(initial_zeeman)
 
     # Evolve the system till we reach the final zeeman.
     i = 0
@@ -78,10 +99,12 @@ def run_adiabatic_zeeman_change(circuit, qreg, initial_zeeman, final_zeeman,
         zeeman_step = min(max(gap_fraction*gap, min_increment),
                           zeeman_distance)
         zi += zeeman_update_sign*zeeman_step
-        trotter(circuit, qreg, zi, coupler_inter, dt, trotter_step_number)
+        gates_saved += evolve(zi)
 
         zeeman_distance -= zeeman_step
 
+    return gates_saved
+
 
 def determine_intermediate_zeemans(initial_zeeman, final_zeeman, method):
     """Determine the intermediate zeeman configurations between two states.
@@ -144,7 +167,7 @@ def determine_intermediate_zeemans(initial_zeeman, final_zeeman, method):
 
 def move_chain(circuit, qreg, initial_zeeman, final_zeeman, coupler_inter,
                gap_fraction, min_increment, delay, trotter_step_number,
-               method='both'):
+               method='both', trotter_tolerance=None):
     """Move the chain by one site step.
 
     The initial and final configurations are deduced from the zeeman fields.
@@ -173,22 +196,35 @@ def move_chain(circuit, qreg, initial_zeeman, final_zeeman, coupler_inter,
     method : {'both', 'single'}
         Should the chain movement occurs only from one side at a time (the
         chain is always elongated first) or from both ends.
+    trotter_tolerance : float, optional
+        Tolerance on the Trotter error used to adapt the number of Trotter
+        steps per field update. See run_adiabatic_zeeman_change.
+
+    Returns
+    -------
+    gates_saved : int
+        Number of gates saved by the adaptive choice of Trotter steps.
 
     """
     zeemans = determine_intermediate_zeemans(initial_zeeman, final_zeeman,
                                              method)
 
+    gates_saved = 0
     i_zeeman = initial_zeeman
     for zeeman in zeemans:
-        run_adiabatic_zeeman_change(circuit, qreg, i_zeeman, zeeman,
-                                    coupler_inter, gap_fraction, min_increment,
-                                    delay, trotter_step_number)
+        gates_saved +=\
+            run_adiabatic_zeeman_change(circuit, qreg, i_zeeman, zeeman,
+                                        coupler_inter, gap_fraction,
+                                        min_increment, delay,
+                                        trotter_step_number, trotter_tolerance)
         i_zeeman = zeeman
 
+    return gates_saved
+
 
 def braid_chain(circuit, qreg, theta, step_number, initial_zeeman,
                 coupler_inter, gap_fraction, min_increment, delay,
-                trotter_step_number, method='both'):
+                trotter_step_number, method='both', trotter_tolerance=None):
     """Perform a full braiding operation on a properly initialized system
 
     Parameters
@@ -219,14 +255,25 @@ def braid_chain(circuit, qreg, theta, step_number, initial_zeeman,
     method : {'both', 'single'}
         Should the chain movement occurs only from one side at a time (the
         chain is always elongated first) or from both ends.
+    trotter_tolerance : float, optional
+        Tolerance on the Trotter error used to adapt the number of Trotter
+        steps per field update. See run_adiabatic_zeeman_change.
+
+    Returns
+    -------
+    gates_saved : int
+        Number of gates saved by the adaptive choice of Trotter steps.
 
     """
     final_zeeman = initial_zeeman[::-1]
-    move_chain(circuit, qreg, initial_zeeman, final_zeeman, coupler_inter,
-               gap_fraction, min_increment, delay, trotter_step_number,
-               method)
+    gates_saved = move_chain(circuit, qreg, initial_zeeman, final_zeeman,
+                             coupler_inter, gap_fraction, min_increment, delay,
+                             trotter_step_number, method, trotter_tolerance)
     mid_braiding_manipulation(circuit, qreg, theta, step_number, final_zeeman,
                               coupler_inter, delay, trotter_step_number)
-    move_chain(circuit, qreg, final_zeeman, initial_zeeman, coupler_inter,
-               gap_fraction, min_increment, delay, trotter_step_number,
-               method)
+    gates_saved += move_chain(circuit, qreg, final_zeeman, initial_zeeman,
+                              coupler_inter, gap_fraction, min_increment,
+                              delay, trotter_step_number, method,
+                              trotter_tolerance)
+
+    return gates_saved
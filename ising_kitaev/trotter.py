@@ -1,6 +1,7 @@
 """Routines used to implement the trotter evolution of the chain.
 
 """
+from math import ceil
 
 
 def pair_interaction(qc, q, i0, i1, coup):
@@ -72,3 +73,83 @@ def trotter(qc, q, zeeman, interaction, dt, nsteps, debug=False):
     for i in range(nsteps):
         trotter_step(qc, q, dt, zeeman*dt, interaction*dt)
 
+
+
+def _bonds(zeeman):
+    """List the pairs of qubits coupled by chain_hamiltonian.
+
+    """
+    n = len(zeeman)
+    return ([(j, j+1) for j in range(0, n, 2)] +
+            [(j, j+1) for j in range(1, n-1, 2)])
+
+
+def trotter_step_gate_count(zeeman, interaction):
+    """Number of gates added to the circuit by a single trotter step.
+
+    Parameters
+    ----------
+    zeeman : np.ndarray
+        Zeeman field per site.
+    interaction : float
+        Strength of the interaction with the coupler.
+
+    """
+    count = 3*len(_bonds(zeeman)) + len(zeeman)
+    if interaction != 0.0:
+        count += 7
+    return count
+
+
+def trotter_error_bound(q, zeeman, interaction, time, nsteps):
+    """Upper bound on the first order Trotter error of an evolution.
+
+    The bound is time**2/(2*nsteps) times the sum of the norms of the
+    commutators between the σ_z σ_z bonds, the σ_x fields and the coupler
+    interaction, as implemented by trotter_step.
+
+    Parameters
+    ----------
+    q : qiskit.QuantumRegister
+        Quantum register describing the qubits, the last qubit is always the
+        coupler.
+    zeeman : np.ndarray
+        Zeeman field per site.
+    interaction : float
+        Strength of the interaction with the coupler.
+    time : float
+        Total duration of the evolution.
+    nsteps : int
+        Number of Trotter steps used for the evolution.
+
+    """
+    # The gates implement H/2, hence the 1/2 factor on each commutator norm.
+    fields = [abs(z) for z in zeeman] + [0.0]
+    commutator = sum(fields[i0] + fields[i1]
+                     for i0, i1 in _bonds(zeeman))/2
+    if interaction != 0.0:
+        m = int(len(q)/2-1)
+        commutator += abs(interaction)*(fields[m] + fields[m+1])/2
+    return time**2*commutator/(2*nsteps)
+
+
+def adaptive_trotter_step_number(q, zeeman, interaction, time, tolerance):
+    """Smallest number of Trotter steps keeping the error below a tolerance.
+
+    Parameters
+    ----------
+    q : qiskit.QuantumRegister
+        Quantum register describing the qubits, the last qubit is always the
+        coupler.
+    zeeman : np.ndarray
+        Zeeman field per site.
+    interaction : float
+        Strength of the interaction with the coupler.
+    time : float
+        Total duration of the evolution.
+    tolerance : float
+        Maximal acceptable Trotter error for the evolution.
+
+    """
+    error = trotter_error_bound(q, zeeman, interaction, time, 1)
+    return max(1, int(ceil(error/tolerance)))